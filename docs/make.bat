@@ -7,6 +7,10 @@ REM Command file for Sphinx documentation
 if "%SPHINXBUILD%" == "" (
 	set SPHINXBUILD=sphinx-build
 )
+if "%SPHINXOPTS%" == "" (
+	REM -j auto parallelizes reading/writing pages across all cores
+	set SPHINXOPTS=-j auto
+)
 set SOURCEDIR=source
 set BUILDDIR=../../nextorch-docs
 set SPHINXPROJ=nextorch
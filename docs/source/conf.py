@@ -108,9 +108,12 @@ todo_include_todos = True
 html_logo = './logos/nextorch_logo_1.png'
 html_favicon = './logos/x_icon.ico'
 
-# auto mock imports 
-# This will allow your docs to import the example code 
+# auto mock imports
+# This will allow your docs to import the example code
 # without requiring those modules be installed.
+# Keep this list in sync with the heavy runtime dependencies: the docs
+# environment (see docs/requirements.txt) installs none of them, so
+# dropping an entry here breaks autodoc on Read the Docs.
 autodoc_mock_imports = ['torch', 'pyDOE2', 'scipy', 'gpytorch', 'botorch', 'numpy', 'pandas', 'matplotlib', 'mpl_toolkits']
 
 
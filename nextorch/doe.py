@@ -6,7 +6,6 @@ Includes full factorial design, latin hypercube design and random design
 
 import itertools
 import numpy as np
-import scipy
 from typing import Optional, TypeVar, List
 # Create a type variable for 1D arrays from numpy
 Array = TypeVar('Array')
@@ -14,7 +13,8 @@ Array = TypeVar('Array')
 Matrix = TypeVar('Matrix')
 
 
-import pyDOE2 as DOE 
+# pyDOE2 and scipy are imported lazily inside the functions that need
+# them, so importing this module does not pay their startup cost
 import nextorch.utils as ut
 
 
@@ -33,6 +33,7 @@ def full_factorial(levels: List[int]) -> Matrix:
         Normalized sampling plan with the shape of prod(level_i) * m
     """    
     # Import DOE function
+    import pyDOE2 as DOE
     DOE_function = DOE.fullfact
     X_real = DOE_function(levels)
 
@@ -71,6 +72,7 @@ def latin_hypercube(
     X_unit: Matrix
         Normalized sampling plan with the shape of n_point * n_dim
     """    
+    import pyDOE2 as DOE
     X_unit = DOE.lhs(n_dim, samples = n_points, criterion = criterion, random_state= seed)
 
     return X_unit
@@ -128,7 +130,7 @@ def randomized_design_w_levels(
     """    
     n_dim = len(levels)
     n_points = np.prod(levels)  # number of points
-    X_unit = np.zeros((n_points, n_dim))
+    X_unit = np.empty((n_points, n_dim)) # every row is assigned below
     x_vectors = []
     # Each dimension has 1d random design of level_i points
     for i, level_i in enumerate(levels):
@@ -162,11 +164,13 @@ def norm_transform(X_norm: Matrix, means: List[float], stdvs: List[float]) -> Ma
     X_transformed: Matrix
         Transformed sampling plan with the shape of n_points*n_dim
     """     
+    from scipy import stats
+
     n_dim = X_norm.shape[1] # number of independent variables
-    X_transformed = np.zeros(X_norm.shape) # copy
+    X_transformed = np.empty(X_norm.shape) # every column is assigned below
 
     for i in range(n_dim):
-        X_transformed[:, i] = scipy.stats.norm(loc=means[i], scale=stdvs[i]).ppf(X_norm[:, i])
+        X_transformed[:, i] = stats.norm(loc=means[i], scale=stdvs[i]).ppf(X_norm[:, i])
 
     return X_transformed
 
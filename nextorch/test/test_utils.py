@@ -0,0 +1,30 @@
+"""
+Test on scaling utility functions
+"""
+import numpy as np
+
+import nextorch.utils as ut
+
+X_ranges = [[10, 20], [1, 5]]
+X_real = np.array([[10.0, 1.0], [15.0, 3.0], [20.0, 5.0]])
+X_unit = np.array([[0.0, 0.0], [0.5, 0.5], [1.0, 1.0]])
+
+
+def test_unitscale_X():
+    assert np.all(ut.unitscale_X(X_real, X_ranges) == X_unit)
+
+def test_inverse_unitscale_X():
+    assert np.all(ut.inverse_unitscale_X(X_unit, X_ranges) == X_real)
+
+def test_unitscale_roundtrip():
+    X_back = ut.inverse_unitscale_X(ut.unitscale_X(X_real, X_ranges), X_ranges)
+    assert np.allclose(X_back, X_real)
+
+def test_unitscale_log_flags():
+    Xunit = ut.unitscale_X(X_real, X_ranges, log_flags = [False, True])
+    assert np.allclose(Xunit[:, 0], X_unit[:, 0])
+    assert np.allclose(Xunit[1:, 1], np.log10(X_unit[1:, 1]))
+
+def test_unitscale_decimals():
+    Xunit = ut.unitscale_X(np.array([[10.123, 1.0]]), X_ranges, decimals = 2)
+    assert np.all(Xunit == np.array([[0.01, 0.0]]))
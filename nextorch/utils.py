@@ -13,6 +13,7 @@ Utility functions for Bayesian Optimization
 #from nextorch.bo import ParameterSpace
 import numpy as np
 import copy
+from functools import lru_cache
 import torch
 from torch import Tensor, tensor 
 
@@ -32,6 +33,38 @@ MatrixLike2d = Union[list, Matrix, Tensor]
 dtype = torch.float
 torch.set_default_dtype(dtype)
 
+# Constant for computing 10**x as exp2(x * log2(10))
+_LOG2_10 = np.log2(10.0)
+
+# Optional numba acceleration for the scaling kernels
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Optional compiled C kernels, built from _scale.pyx when Cython is
+# available at install time
+try:
+    from nextorch import _scale
+except ImportError:
+    _scale = None
+
+if HAS_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _unitscale_kernel(X, lb, width, log_mask, out):
+        """Compiled unit scaling, fusing the log transform into one pass
+        with the rows parallelized across threads"""
+        for j in range(X.shape[1]):
+            inv_j = 1.0 / width[j]
+            lb_j = lb[j]
+            log_j = log_mask[j]
+            for i in prange(X.shape[0]):
+                v = (X[i, j] - lb_j) * inv_j
+                if log_j:
+                    v = np.log10(v)
+                out[i, j] = v
+
 
 from nextorch.parameter import ParameterSpace
 #%% Type conversion
@@ -122,8 +155,7 @@ def expand_ranges_X(X_ranges: MatrixLike2d) -> list:
 
     if isinstance(X_ranges, np.ndarray):
         if len(X_ranges.shape)<2:
-            X_ranges = copy.deepcopy(X_ranges)
-            X_ranges = np.array([X_ranges])
+            X_ranges = np.array([X_ranges]) # np.array copies already
     elif isinstance(X_ranges, list):
         X_ranges = expand_list(X_ranges)
     else:
@@ -158,6 +190,59 @@ def get_ranges_X(X: MatrixLike2d) -> list:
     return X_ranges
 
 
+@lru_cache(maxsize=32)
+def _range_bounds_cached(ranges_tuple: tuple) -> Tuple[Array, Array]:
+    """Build the bound vectors from a hashable tuple of ranges
+
+    Parameters
+    ----------
+    ranges_tuple : tuple
+        tuple of (left bound, right bound) pairs
+
+    Returns
+    -------
+    lb: Array
+        left bounds, one per dimension
+    width: Array
+        range widths, one per dimension
+    inv_width: Array
+        reciprocal range widths, one per dimension
+    """
+    X_ranges = np.asarray(ranges_tuple, dtype=float)
+    lb = X_ranges[:, 0]
+    width = X_ranges[:, 1] - X_ranges[:, 0]
+    # Precompute the reciprocal so unit scaling multiplies instead of divides
+    inv_width = np.reciprocal(width)
+
+    return lb, width, inv_width
+
+
+def _range_bounds(X_ranges: MatrixLike2d) -> Tuple[Array, Array]:
+    """Build the left bound and width vectors from X_ranges
+
+    In a BO loop the same ranges are converted hundreds of times,
+    so the arrays are memoized on a tuple key. The returned arrays
+    are shared and must not be modified in place.
+
+    Parameters
+    ----------
+    X_ranges : MatrixLike2d
+        list of x ranges (in 2d)
+
+    Returns
+    -------
+    lb: Array
+        left bounds, one per dimension
+    width: Array
+        range widths, one per dimension
+    inv_width: Array
+        reciprocal range widths, one per dimension
+    """
+    ranges_tuple = tuple((float(ri[0]), float(ri[1])) for ri in X_ranges)
+
+    return _range_bounds_cached(ranges_tuple)
+
+
 def unitscale_xv(xv: ArrayLike1d, xi_range: ArrayLike1d) -> ArrayLike1d:
     """
     Takes in an x array in a real scale
@@ -175,7 +260,6 @@ def unitscale_xv(xv: ArrayLike1d, xi_range: ArrayLike1d) -> ArrayLike1d:
     xunit: ArrayLike1d, same type as xv
         normalized x in a unit scale
     """    
-    xunit = copy.deepcopy(xv)
     lb = xi_range[0] #the left bound
     rb = xi_range[1] #the right bound
     xunit = (xv - lb)/(rb - lb)
@@ -213,32 +297,59 @@ def unitscale_X(
         matrix scaled to a unit scale
     """
     
+    # Convert to numpy matrix for computation
+    if isinstance(X, Tensor):
+        X = tensor_to_np(X)
     #If 1D, make it 2D a matrix
     if len(X.shape)<2:
-        X = copy.deepcopy(X)
         X = np.expand_dims(X, axis=1) # If 1D, make it 2D array
-        
+    # Promote ints to float but keep single precision inputs as float32
+    if not np.issubdtype(X.dtype, np.floating):
+        X = X.astype(float)
+
     n_dim = X.shape[1] #the number of column in X
 
     if X_ranges is None: # X_ranges not defined
         X_ranges = get_ranges_X(X)
     X_ranges = expand_ranges_X(X_ranges) #expand to 2d
-    
-    if log_flags is None: log_flags = [False] * n_dim
-    
-    # Initialize with a zero matrix
-    Xunit = np.zeros((X.shape[0], X.shape[1]))
-    for i in range(n_dim):
-        xi = X[:,i]
-        Xunit[:,i] =  unitscale_xv(xi, X_ranges[i])
+
+    lb, width, inv_width = _range_bounds(X_ranges)
+    # Cast the bounds so the arithmetic does not upcast float32 input
+    lb = lb.astype(X.dtype, copy=False)
+    width = width.astype(X.dtype, copy=False)
+    inv_width = inv_width.astype(X.dtype, copy=False)
+    if log_flags is None:
+        log_mask = np.zeros(n_dim, dtype=bool)
+    else:
+        log_mask = np.asarray(log_flags, dtype=bool)
+
+    if (_scale is not None and X.dtype == np.float32
+            and X.flags['C_CONTIGUOUS']):
+        # C kernel for single precision, one fused pass
+        Xunit = np.empty_like(X)
+        _scale.unitscale_f32(X, lb, inv_width,
+                             log_mask.astype(np.uint8), Xunit)
+    elif HAS_NUMBA:
+        # Compiled kernel, one fused pass with no intermediates
+        # Column-major layout so the kernel reads each column contiguously
+        if X.shape[0] > X.shape[1]:
+            X = np.asfortranarray(X)
+        else:
+            X = np.ascontiguousarray(X)
+        Xunit = np.empty(X.shape, dtype=X.dtype)
+        _unitscale_kernel(X, lb, width, log_mask, Xunit)
+    else:
+        # Scale all columns at once with broadcasting
+        # Multiply by the reciprocal width, cheaper than dividing
+        Xunit = (X - lb) * inv_width
         # Operate on a log scale
-        if log_flags[i]:
-            Xunit[:,i] =  np.log10(Xunit[:,i])
-            
-    # Round up if necessary
-    if not decimals == None:
-        Xunit = np.around(Xunit, decimals = decimals)  
-    
+        if log_mask.any():
+            Xunit[:, log_mask] = np.log10(Xunit[:, log_mask])
+
+    # Round up in place if necessary
+    if decimals is not None:
+        np.around(Xunit, decimals = decimals, out = Xunit)
+
     return Xunit
 
 
@@ -259,7 +370,6 @@ def inverse_unitscale_xv(xv: ArrayLike1d, xi_range: ArrayLike1d) -> ArrayLike1d:
     xv: ArrayLike1d, same type as xv
         x in a real scale
     """ 
-    xreal = copy.deepcopy(xv)
     lb = xi_range[0] #the left bound
     rb = xi_range[1] #the right bound
     xreal = lb + (rb-lb)*xv
@@ -296,31 +406,48 @@ def inverse_unitscale_X(
     Xunit: numpy matrix
         matrix scaled to a real scale
     """
+    # Convert to numpy matrix for computation
+    if isinstance(X, Tensor):
+        X = tensor_to_np(X)
     if len(X.shape)<2:
-        X = copy.deepcopy(X)
         X = np.expand_dims(X, axis=1) #If 1D, make it 2D array
-    
+    # Promote ints to float but keep single precision inputs as float32
+    if not np.issubdtype(X.dtype, np.floating):
+        X = X.astype(float)
+
     n_dim = X.shape[1]  #the number of column in X
-    
+
     if X_ranges is None: # X_ranges not defined
         X_ranges = get_ranges_X(X)
     X_ranges = expand_ranges_X(X_ranges) #expand to 2d
-    
-    if log_flags is None: log_flags = [False] * n_dim
-    
-    # Initialize with a zero matrix
-    Xreal = np.zeros((X.shape[0], X.shape[1]))
-    for i in range(n_dim):
-        xi = X[:,i]
-        Xreal[:,i] =  inverse_unitscale_xv(xi, X_ranges[i])
+
+    lb, width, _ = _range_bounds(X_ranges)
+    # Cast the bounds so the arithmetic does not upcast float32 input
+    lb = lb.astype(X.dtype, copy=False)
+    width = width.astype(X.dtype, copy=False)
+    if log_flags is None:
+        log_mask = np.zeros(n_dim, dtype=bool)
+    else:
+        log_mask = np.asarray(log_flags, dtype=bool)
+
+    if (_scale is not None and X.dtype == np.float32
+            and X.flags['C_CONTIGUOUS']):
+        # C kernel for single precision, one fused pass
+        Xreal = np.empty_like(X)
+        _scale.inverse_unitscale_f32(X, lb, width,
+                                     log_mask.astype(np.uint8), Xreal)
+    else:
+        # Scale all columns at once with broadcasting
+        Xreal = lb + width * X
         # Operate on a log scale
-        if log_flags[i]:
-            Xreal[:,i] =  10**(Xreal[:,i])
-            
-    # Round up if necessary
-    if not decimals == None:
-        Xreal = np.around(Xreal, decimals = decimals)  
-    
+        if log_mask.any():
+            # exp2 hits the hardware fast path, unlike a scalar-base power
+            Xreal[:, log_mask] = np.exp2(Xreal[:, log_mask] * _LOG2_10)
+
+    # Round up in place if necessary
+    if decimals is not None:
+        np.around(Xreal, decimals = decimals, out = Xreal)
+
     return Xreal
 
 
@@ -358,24 +485,42 @@ def standardize_X(
     ValueError
         if input return_type not defined
     """    
-    # Compute the mean and std if not provided
-
+    # Compute the mean and inverse std if not provided
+    # Use a fused single-pass reduction instead of separate mean/std passes
     if X_mean is None:
-        X_mean = X.mean(axis = 0)
-        X_std = X.std(axis = 0)
+        if isinstance(X, Tensor):
+            # var_mean is a single fused kernel
+            X_var, X_mean = torch.var_mean(X, dim = 0, unbiased = True)
+            # rsqrt is a single instruction, cheaper than sqrt followed by div
+            X_inv_std = torch.rsqrt(X_var + 1e-12)
+        else:
+            n_points = X.shape[0]
+            X_sum = X.sum(axis = 0)
+            X_sum2 = (X * X).sum(axis = 0)
+            X_mean = X_sum / n_points
+            # Clip at zero in case of cancellation on constant columns
+            X_var = np.maximum(X_sum2 / n_points - X_mean * X_mean, 0.0)
+            X_inv_std = np.reciprocal(np.sqrt(X_var + 1e-12))
+    else:
+        # Invert the given std once so the scaling below is a multiply
+        if isinstance(X_std, Tensor):
+            X_inv_std = torch.reciprocal(X_std)
+        else:
+            X_inv_std = np.reciprocal(np.asarray(X_std, dtype = float))
     if return_type == 'tensor':
         X = np_to_tensor(X)
-        X_mean = np_to_tensor(X_mean)
-        X_std = np_to_tensor(X_std)
+        # Keep the statistics on the device of X
+        X_mean = torch.as_tensor(X_mean, dtype = X.dtype, device = X.device)
+        X_inv_std = torch.as_tensor(X_inv_std, dtype = X.dtype, device = X.device)
     elif return_type == 'np':
         X = tensor_to_np(X)
         X_mean = tensor_to_np(X_mean)
-        X_std = tensor_to_np(X_std)
-    
-    else: 
+        X_inv_std = tensor_to_np(X_inv_std)
+
+    else:
         raise ValueError('return_type must be either tensor or np')
-        
-    return (X - X_mean) / X_std
+
+    return (X - X_mean) * X_inv_std
 
 
 
@@ -414,21 +559,24 @@ def inverse_standardize_X(
         if input return_type not defined
     """    
     if return_type == 'tensor':
-        X = np_to_tensor(X)
-        X_mean = np_to_tensor(X_mean)
-        X_std = np_to_tensor(X_std)
+        if isinstance(X, Tensor):
+            X = X.detach()
+        else:
+            X = torch.tensor(X, dtype = dtype)
+        # Keep the computation on the device of X
+        X_mean = torch.as_tensor(X_mean, dtype = X.dtype, device = X.device)
+        X_std = torch.as_tensor(X_std, dtype = X.dtype, device = X.device)
+        # Fused multiply-add, a single kernel with one output allocation
+        X_real = torch.addcmul(X_mean, X, X_std)
     elif return_type == 'np':
         X = tensor_to_np(X)
         X_mean = tensor_to_np(X_mean)
         X_std = tensor_to_np(X_std)
-    else: 
+        X_real = np.multiply(X, X_std) # element by element multiplication
+        X_real += X_mean # in place, avoids a second full-size temporary
+    else:
         raise ValueError('return_type must be either tensor or np')
 
-    if isinstance(X, Tensor):
-        X_real = X * X_std +  X_mean
-    else:
-        X_real = np.multiply(X, X_std) +  X_mean # element by element multiplication
-    
     return X_real
 
 
@@ -456,15 +604,11 @@ def create_X_mesh_2d(mesh_size: Optional[int] = 41
     x1 = np.linspace(0, 1, nx1)
     x2 = np.linspace(0, 1, nx2)
     # Use Cartesian indexing, the matrix indexing is wrong
-    X1, X2 = np.meshgrid(x1, x2,  indexing='xy') 
-    
-    X_test = []
-    for i in range(nx1):
-        for j in range(nx2):
-            X_test.append([X1[i,j], X2[i,j]])
-    
-    X_test = np.array(X_test)
-    
+    X1, X2 = np.meshgrid(x1, x2,  indexing='xy')
+
+    # Stack the flattened mesh coordinates as columns
+    X_test = np.column_stack((X1.ravel(), X2.ravel()))
+
     return X_test, X1, X2
 
   
@@ -488,9 +632,11 @@ def transform_Y_mesh_2d(X: ArrayLike1d, mesh_size: Optional[int] = 41
         in real units for plotting
         
     """
-    X = tensor_to_np(X)
-
     # Convert to numpy for plotting
+    # a single host transfer for tensors, no defensive copy for arrays
+    if isinstance(X, Tensor):
+        X = X.detach().cpu().numpy()
+
     X_plot2D = np.reshape(X, (mesh_size, mesh_size))
     
     return X_plot2D
@@ -1027,12 +1173,12 @@ def real_to_encode_X(
     
     if log_flags is None: log_flags = [False] * n_dim
     
-    # Initialize with a zero matrix
-    Xencode = np.zeros((X.shape[0], X.shape[1]))
+    # Initialize the output; every column below is fully overwritten
+    Xencode = np.empty((X.shape[0], X.shape[1]))
     for i in range(n_dim):
         xi = X[:,i]
         # scale based on the type
-        if X_types[i] == 'continuous':  
+        if X_types[i] == 'continuous':
             Xencode[:,i] =  unitscale_xv(xi, X_ranges[i])
         else: #categorical and oridinal
             encoding_unit = unitscale_xv(encodings[i], X_ranges[i])
@@ -1042,10 +1188,10 @@ def real_to_encode_X(
         if log_flags[i]: 
             Xencode[:,i] =  np.log10(Xencode[:, i])
     
-    # Round up if necessary
-    if not decimals == None:
-        Xencode = np.around(Xencode, decimals = decimals)  
-    
+    # Round up in place if necessary
+    if decimals is not None:
+        np.around(Xencode, decimals = decimals, out = Xencode)
+
     return Xencode
 
 
@@ -1097,12 +1243,12 @@ def unit_to_encode_X(
     
     if log_flags is None: log_flags = [False] * n_dim
     
-    # Initialize with a zero matrix
-    Xencode = np.zeros((X.shape[0], X.shape[1]))
+    # Initialize the output; every column below is fully overwritten
+    Xencode = np.empty((X.shape[0], X.shape[1]))
     for i in range(n_dim):
         xi = X[:,i]
         # scale based on the type
-        if X_types[i] == 'continuous':  
+        if X_types[i] == 'continuous':
             Xencode[:, i] = xi
         else: #categorical and oridinal
             encoding_unit = unitscale_xv(encodings[i], X_ranges[i])
@@ -1112,10 +1258,10 @@ def unit_to_encode_X(
         if log_flags[i]: 
             Xencode[:,i] =  np.log10(Xencode[:, i])
     
-    # Round up if necessary
-    if not decimals == None:
-        Xencode = np.around(Xencode, decimals = decimals)  
-    
+    # Round up in place if necessary
+    if decimals is not None:
+        np.around(Xencode, decimals = decimals, out = Xencode)
+
     return Xencode
 
 
@@ -1175,12 +1321,13 @@ def encode_to_real_X(
     
     if log_flags is None: log_flags = [False] * n_dim
     
-    # Initialize with a zero matrix
-    Xreal = np.zeros((X.shape[0], X.shape[1]), dtype=object)
-
+    # Initialize the output; every column below is fully overwritten
+    # Use the object dtype if there are categorical str values
     if all_continuous:
-        Xreal = np.zeros((X.shape[0], X.shape[1]))
-    
+        Xreal = np.empty((X.shape[0], X.shape[1]))
+    else:
+        Xreal = np.empty((X.shape[0], X.shape[1]), dtype=object)
+
     for i in range(n_dim):
         xi = X[:,i]
         # scale based on the type
@@ -1194,9 +1341,10 @@ def encode_to_real_X(
             Xreal[:,i] =  10**(Xreal[:,i])
     
     # Round up if necessary
-    if not decimals == None:
-        Xreal = np.around(Xreal, decimals = decimals)  
-    
+    # No out= here since Xreal may hold categorical (object) values
+    if decimals is not None:
+        Xreal = np.around(Xreal, decimals = decimals)
+
     return Xreal
 
 
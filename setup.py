@@ -15,6 +15,15 @@ root_dir = os.path.dirname(__file__)
 with open(os.path.join(root_dir, "README.rst"), "r") as fh:
 	long_description = fh.read()
 
+# Build the optional compiled scaling kernels when Cython is available;
+# nextorch falls back to the NumPy implementation without them.
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        [setuptools.Extension("nextorch._scale", ["nextorch/_scale.pyx"])])
+except ImportError:
+    ext_modules = []
+
 
 setuptools.setup(
     name="nextorch", 
@@ -30,7 +39,8 @@ setuptools.setup(
         "Source": "https://github.com/VlachosGroup/nextorch",
     },
     packages=setuptools.find_packages(),
-    package_data={'':['*.xlsx']},
+    ext_modules=ext_modules,
+    package_data={'':['*.xlsx'], 'nextorch':['*.pyx']},
     include_package_data=True,
     python_requires=">=3.7",
     install_requires=[